@@ -1,5 +1,5 @@
 import numpy as np
-from typing import Generator
+from typing import Generator, Union
 
 import tree_sitter as ts
 import tree_sitter_python as tspython
@@ -25,6 +25,45 @@ from astchunk.preprocessing import (
 )
 
 
+# Grammars bundled as tree-sitter bindings, keyed by supported language name.
+# Languages missing here are looked up in tree-sitter-language-pack instead.
+_LANGUAGE_LOADERS = {
+    "python": tspython.language,
+    "java": tsjava.language,
+    "csharp": tscsharp.language,
+    "typescript": tstypescript.language_tsx,
+    "yaml": yaml.language,
+    "json": json.language,
+    "xml": tsxml.language_xml,
+    "dockerfile": dockerfile.language,
+    "toml": toml.language,
+    "hcl": tshcl.language,
+}
+
+# Languages that share another language's grammar.
+_LANGUAGE_ALIASES = {
+    "terraform": "hcl",
+}
+
+_LANG_CACHE: dict[str, ts.Language] = {}
+
+
+def _load_language(grammar: str) -> ts.Language:
+    """
+    Load the tree-sitter Language for a bundled grammar, creating it at most once per process
+    so that all builders for the same grammar share one Language object.
+
+    Args:
+        grammar: key of _LANGUAGE_LOADERS
+
+    Returns:
+        The tree-sitter Language object for that grammar
+    """
+    if grammar not in _LANG_CACHE:
+        _LANG_CACHE[grammar] = ts.Language(_LANGUAGE_LOADERS[grammar]())
+    return _LANG_CACHE[grammar]
+
+
 class ASTChunkBuilder():
     """
     Attributes:
@@ -37,26 +76,9 @@ class ASTChunkBuilder():
         self.language: str = configs['language']
         self.metadata_template: str = configs['metadata_template']
 
-        if self.language == "python":
-            self.parser = ts.Parser(ts.Language(tspython.language()))
-        elif self.language == "java":
-            self.parser = ts.Parser(ts.Language(tsjava.language()))
-        elif self.language == "csharp":
-            self.parser = ts.Parser(ts.Language(tscsharp.language()))
-        elif self.language == "typescript":
-            self.parser = ts.Parser(ts.Language(tstypescript.language_tsx()))
-        elif self.language == "yaml":
-            self.parser = ts.Parser(ts.Language(yaml.language()))
-        elif self.language == "json":
-            self.parser = ts.Parser(ts.Language(json.language()))
-        elif self.language == "xml":
-            self.parser = ts.Parser(ts.Language(tsxml.language_xml()))
-        elif self.language == "dockerfile":
-            self.parser = ts.Parser(ts.Language(dockerfile.language()))
-        elif self.language == "toml":
-            self.parser = ts.Parser(ts.Language(toml.language()))
-        elif self.language == "hcl" or self.language == "terraform":
-            self.parser = ts.Parser(ts.Language(tshcl.language()))
+        grammar = _LANGUAGE_ALIASES.get(self.language, self.language)
+        if grammar in _LANGUAGE_LOADERS:
+            self.parser = ts.Parser(_load_language(grammar))
         else:
             try:
                 self.parser = get_parser(self.language)
@@ -69,7 +91,7 @@ class ASTChunkBuilder():
     # ------------------------------ #
     #            Step #1             #
     # ------------------------------ #
-    def assign_tree_to_windows(self, code: str, root_node: ts.Node) -> Generator[list[ASTNode], None, None]:
+    def assign_tree_to_windows(self, code: Union[str, bytes], root_node: ts.Node) -> Generator[list[ASTNode], None, None]:
         """
         Assign AST tree to windows. A window is a tentative chunk consists of ASTNode before being converted into ASTChunk.
 
@@ -79,14 +101,15 @@ class ASTChunkBuilder():
             2. handles the edge case where the entire AST tree can fit in one window.
 
         Args:
-            code: code to be chunked
+            code: code to be chunked, either as str or as UTF-8 encoded bytes
             root_node: root node of the AST tree
 
         Yields:
             Lists (windows) of ASTNode
         """
         # Preprocessing non-whitespace character count
-        nws_cumsum = preprocess_nws_count(bytes(code, "utf8"))
+        code_bytes = code if isinstance(code, bytes) else bytes(code, "utf8")
+        nws_cumsum = preprocess_nws_count(code_bytes)
         tree_range = ByteRange(root_node.start_byte, root_node.end_byte)
         tree_size = get_nws_count(nws_cumsum, tree_range)
 
@@ -317,19 +340,27 @@ class ASTChunkBuilder():
     # ------------------------------ #
     #       AST Chunking Logic       #
     # ------------------------------ #
-    def chunkify(self, code: str, **configs) -> list[dict]:
+    def chunkify(self, code: Union[str, bytes], **configs) -> list[dict]:
         '''
         Parse a piece of code into structual-aware chunks using AST.
 
+        Empty or whitespace-only code yields no chunks and is never handed to the parser.
+
         Args:
-            code: code to be chunked
+            code: code to be chunked, either as str or as UTF-8 encoded bytes
             **configs: additional arguments for building chunks and/or chunk metadata
         '''
+        if not code or code.isspace():
+            return []
+
+        # encode once and share the bytes between parsing and preprocessing
+        code_bytes = code if isinstance(code, bytes) else bytes(code, "utf8")
+
         # step 1: greedily assign AST tree / AST nodes to windows
         #         see self.assign_tree_to_windows() and self.assign_nodes_to_windows() for details
-        ast = self.parser.parse(bytes(code, "utf8"))
+        ast = self.parser.parse(code_bytes)
         ast_windows = list(self.assign_tree_to_windows(
-            code=code, 
+            code=code_bytes, 
             root_node=ast.root_node
         ))
         # [after this step]: list[list[ASTNode]] where each sublist represents an AST window
@@ -0,0 +1,29 @@
+"""
+Shared helpers for the test suite.
+"""
+
+import functools
+
+from astchunk import ASTChunkBuilder
+
+
+@functools.lru_cache(maxsize=None)
+def _builder(language, max_chunk_size, metadata_template="default"):
+    """
+    Return a cached ASTChunkBuilder for the given configuration.
+
+    Building a chunk builder sets up a tree-sitter grammar and parser, which dominates
+    the cost of chunking the small inputs used in tests, so builders are shared across tests.
+    """
+    return ASTChunkBuilder(
+        max_chunk_size=max_chunk_size,
+        language=language,
+        metadata_template=metadata_template
+    )
+
+
+def _chunk_sizes(chunks):
+    """
+    Return the content length of each chunk, for logging.
+    """
+    return [len(c['content']) for c in chunks]
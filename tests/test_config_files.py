@@ -1,10 +1,23 @@
-from astchunk import ASTChunkBuilder
+import logging
 
-def test_dockerfile():
-    """Test Dockerfile chunking"""
-    print("\n=== Testing Dockerfile ===")
-    
-    dockerfile = """
+import pytest
+
+from _helpers import _builder, _chunk_sizes
+
+log = logging.getLogger(__name__)
+
+# Chunk builder configs, keyed by (language, max_chunk_size)
+_CFG = {
+    (language, max_chunk_size): {
+        "max_chunk_size": max_chunk_size,
+        "language": language,
+        "metadata_template": "default"
+    }
+    for language, max_chunk_size in [("dockerfile", 100), ("json", 150), ("xml", 200), ("toml", 150), ("properties", 120)]
+}
+
+
+DOCKERFILE = """
 FROM python:3.11-slim
 
 WORKDIR /app
@@ -21,30 +34,8 @@ EXPOSE 8080
 
 CMD ["python", "app.py"]
 """
-    
-    configs = {
-        "max_chunk_size": 100,
-        "language": "dockerfile",
-        "metadata_template": "default"
-    }
-    
-    chunk_builder = ASTChunkBuilder(**configs)
-    chunks = chunk_builder.chunkify(dockerfile)
-    
-    print(f"✓ Generated {len(chunks)} chunks")
-    assert len(chunks) > 0
-    
-    for i, chunk in enumerate(chunks):
-        print(f"  Chunk {i+1}: {len(chunk['content'])} chars")
-    
-    print("✓ Dockerfile test passed\n")
-
 
-def test_package_json():
-    """Test package.json chunking"""
-    print("=== Testing package.json ===")
-    
-    package_json = """
+PACKAGE_JSON = """
 {
   "name": "my-app",
   "version": "1.0.0",
@@ -72,30 +63,8 @@ def test_package_json():
   }
 }
 """
-    
-    configs = {
-        "max_chunk_size": 150,
-        "language": "json",
-        "metadata_template": "default"
-    }
-    
-    chunk_builder = ASTChunkBuilder(**configs)
-    chunks = chunk_builder.chunkify(package_json)
-    
-    print(f"✓ Generated {len(chunks)} chunks")
-    assert len(chunks) > 0
-    
-    for i, chunk in enumerate(chunks):
-        print(f"  Chunk {i+1}: {len(chunk['content'])} chars")
-    
-    print("✓ package.json test passed\n")
-
 
-def test_pom_xml():
-    """Test pom.xml chunking"""
-    print("=== Testing pom.xml ===")
-    
-    pom_xml = """
+POM_XML = """
 <?xml version="1.0" encoding="UTF-8"?>
 <project xmlns="http://maven.apache.org/POM/4.0.0">
     <modelVersion>4.0.0</modelVersion>
@@ -141,30 +110,8 @@ def test_pom_xml():
     </build>
 </project>
 """
-    
-    configs = {
-        "max_chunk_size": 200,
-        "language": "xml",
-        "metadata_template": "default"
-    }
-    
-    chunk_builder = ASTChunkBuilder(**configs)
-    chunks = chunk_builder.chunkify(pom_xml)
-    
-    print(f"✓ Generated {len(chunks)} chunks")
-    assert len(chunks) > 0
-    
-    for i, chunk in enumerate(chunks):
-        print(f"  Chunk {i+1}: {len(chunk['content'])} chars")
-    
-    print("✓ pom.xml test passed\n")
 
-
-def test_pyproject_toml():
-    """Test pyproject.toml chunking"""
-    print("=== Testing pyproject.toml ===")
-    
-    pyproject_toml = """
+PYPROJECT_TOML = """
 [build-system]
 requires = ["setuptools>=61.0", "wheel"]
 build-backend = "setuptools.build_meta"
@@ -203,30 +150,8 @@ python_version = "3.8"
 warn_return_any = true
 warn_unused_configs = true
 """
-    
-    configs = {
-        "max_chunk_size": 150,
-        "language": "toml",
-        "metadata_template": "default"
-    }
-    
-    chunk_builder = ASTChunkBuilder(**configs)
-    chunks = chunk_builder.chunkify(pyproject_toml)
-    
-    print(f"✓ Generated {len(chunks)} chunks")
-    assert len(chunks) > 0
-    
-    for i, chunk in enumerate(chunks):
-        print(f"  Chunk {i+1}: {len(chunk['content'])} chars")
-    
-    print("✓ pyproject.toml test passed\n")
 
-
-def test_application_properties():
-    """Test .properties file chunking"""
-    print("=== Testing application.properties ===")
-    
-    properties_file = """
+APPLICATION_PROPERTIES = """
 # Database Configuration
 spring.datasource.url=jdbc:postgresql://localhost:5432/mydb
 spring.datasource.username=dbuser
@@ -251,41 +176,30 @@ logging.pattern.console=%d{yyyy-MM-dd HH:mm:ss} - %msg%n
 app.name=MyApplication
 app.version=1.0.0
 """
-    
-    configs = {
-        "max_chunk_size": 120,
-        "language": "properties",
-        "metadata_template": "default"
-    }
-    
-    chunk_builder = ASTChunkBuilder(**configs)
-    chunks = chunk_builder.chunkify(properties_file)
-    
-    print(f"✓ Generated {len(chunks)} chunks")
+
+
+@pytest.mark.parametrize(
+    "key,payload",
+    [
+        (("dockerfile", 100), DOCKERFILE),
+        (("json", 150), PACKAGE_JSON),
+        (("xml", 200), POM_XML),
+        (("toml", 150), PYPROJECT_TOML),
+        (("properties", 120), APPLICATION_PROPERTIES),
+    ],
+    ids=["dockerfile", "package.json", "pom.xml", "pyproject.toml", "application.properties"]
+)
+def test_config_chunking(key, payload):
+    """Test chunking of config and build files"""
+    log.info("Testing %s", key[0])
+
+    chunk_builder = _builder(**_CFG[key])
+    chunks = chunk_builder.chunkify(payload)
+
     assert len(chunks) > 0
-    
-    for i, chunk in enumerate(chunks):
-        print(f"  Chunk {i+1}: {len(chunk['content'])} chars")
-    
-    print("✓ application.properties test passed\n")
+
+    log.debug("chunk sizes: %s", _chunk_sizes(chunks))
 
 
 if __name__ == "__main__":
-    print("\n" + "="*60)
-    print("CONFIG & BUILD FILES CHUNKING TEST SUITE")
-    print("="*60)
-    
-    try:
-        test_dockerfile()
-        test_package_json()
-        test_pom_xml()
-        test_pyproject_toml()
-        test_application_properties()
-        
-        print("="*60)
-        print("✓✓✓ ALL CONFIG FILE TESTS PASSED ✓✓✓")
-        print("="*60 + "\n")
-    except Exception as e:
-        print(f"\n✗ TEST FAILED: {e}\n")
-        import traceback
-        traceback.print_exc()
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -1,18 +1,10 @@
-import unittest
+import pytest
 import tree_sitter as ts
-from astchunk.astchunk_builder import ASTChunkBuilder
-
-
-class TestHCLTerraformSupport(unittest.TestCase):
-    """Test cases for HCL and Terraform file parsing support"""
-    
-    def setUp(self):
-        """Set up test fixtures"""
-        self.max_chunk_size = 1000
-        self.metadata_template = "default"
-        
-        # Sample Terraform/HCL code
-        self.sample_terraform_code = '''
+from _helpers import _builder
+
+
+# Sample Terraform/HCL code
+SAMPLE_TERRAFORM = b"""
 resource "aws_instance" "web" {
   ami           = "ami-0c55b159cbfafe1f0"
   instance_type = "t2.micro"
@@ -33,9 +25,9 @@ output "instance_id" {
   description = "ID of the EC2 instance"
   value       = aws_instance.web.id
 }
-'''
-        
-        self.sample_hcl_code = '''
+"""
+
+SAMPLE_HCL = b"""
 locals {
   true = "true"
   false = "false"
@@ -50,104 +42,129 @@ service {
     timeout  = "2s"
   }
 }
-'''
+"""
+
+
+def _point(source, byte):
+    """Return the (row, column) point of a byte offset in source"""
+    return (source.count(b"\n", 0, byte), byte - (source.rfind(b"\n", 0, byte) + 1))
+
+
+def _reparse_subset(parser, tree, source, subset):
+    """
+    Parse subset incrementally, reusing tree (parsed from source) when subset is a slice of source.
+
+    The text around subset is recorded as deleted on a copy of tree, so tree-sitter reuses the
+    untouched nodes instead of parsing subset from scratch. Anything else is parsed cold.
+    """
+    start = source.find(subset)
+    if start < 0:
+        return parser.parse(subset)
+    end = start + len(subset)
+
+    old_tree = tree.copy()
+    # Delete everything after the subset, then everything before it
+    old_tree.edit(
+        start_byte=end,
+        old_end_byte=len(source),
+        new_end_byte=end,
+        start_point=_point(source, end),
+        old_end_point=_point(source, len(source)),
+        new_end_point=_point(source, end),
+    )
+    old_tree.edit(
+        start_byte=0,
+        old_end_byte=start,
+        new_end_byte=0,
+        start_point=(0, 0),
+        old_end_point=_point(source, start),
+        new_end_point=(0, 0),
+    )
+    return parser.parse(subset, old_tree)
+
+
+MAX_CHUNK_SIZE = 1000
+METADATA_TEMPLATE = "default"
+
+
+@pytest.fixture(scope="module")
+def hcl_builder():
+    return _builder("hcl", MAX_CHUNK_SIZE, METADATA_TEMPLATE)
+
+
+@pytest.fixture(scope="module")
+def tf_builder():
+    return _builder("terraform", MAX_CHUNK_SIZE, METADATA_TEMPLATE)
+
+
+@pytest.fixture(scope="module")
+def hcl_tree(hcl_builder):
+    return hcl_builder.parser.parse(SAMPLE_HCL)
+
+
+@pytest.fixture(scope="module")
+def tf_tree(tf_builder):
+    """Baseline tree shared by the tests that parse SAMPLE_TERRAFORM or slices of it"""
+    return tf_builder.parser.parse(SAMPLE_TERRAFORM)
+
+
+def test_hcl_language_initialization(hcl_builder):
+    """Test that ASTChunkBuilder initializes correctly with 'hcl' language"""
+    assert hcl_builder.parser is not None
+    assert hcl_builder.language == "hcl"
+
 
-    def test_hcl_language_initialization(self):
-        """Test that ASTChunkBuilder initializes correctly with 'hcl' language"""
-        builder = ASTChunkBuilder(
-            max_chunk_size=self.max_chunk_size,
-            language="hcl",
-            metadata_template=self.metadata_template
-        )
-        
-        self.assertIsNotNone(builder.parser)
-        self.assertEqual(builder.language, "hcl")
-        
-    def test_terraform_language_initialization(self):
-        """Test that ASTChunkBuilder initializes correctly with 'terraform' language"""
-        builder = ASTChunkBuilder(
-            max_chunk_size=self.max_chunk_size,
-            language="terraform",
-            metadata_template=self.metadata_template
-        )
-        
-        self.assertIsNotNone(builder.parser)
-        self.assertEqual(builder.language, "terraform")
-    
-    def test_parse_terraform_resource_block(self):
-        """Test parsing a Terraform resource block"""
-        builder = ASTChunkBuilder(
-            max_chunk_size=self.max_chunk_size,
-            language="terraform",
-            metadata_template=self.metadata_template
-        )
-        
-        tree = builder.parser.parse(bytes(self.sample_terraform_code, "utf8"))
-        root_node = tree.root_node
-        
-        # Verify parsing was successful (no errors)
-        self.assertFalse(root_node.has_error)
-        
-        # Verify we can traverse the tree
-        self.assertGreater(root_node.child_count, 0)
-        
-    def test_parse_hcl_file(self):
-        """Test parsing a generic HCL file"""
-        builder = ASTChunkBuilder(
-            max_chunk_size=self.max_chunk_size,
-            language="hcl",
-            metadata_template=self.metadata_template
-        )
-        
-        tree = builder.parser.parse(bytes(self.sample_hcl_code, "utf8"))
-        root_node = tree.root_node
-        
-        # Verify parsing was successful
-        self.assertFalse(root_node.has_error)
-        self.assertGreater(root_node.child_count, 0)
-    
-    def test_terraform_variable_block_parsing(self):
-        """Test parsing Terraform variable declarations"""
-        variable_code = '''
+def test_terraform_language_initialization(tf_builder):
+    """Test that ASTChunkBuilder initializes correctly with 'terraform' language"""
+    assert tf_builder.parser is not None
+    assert tf_builder.language == "terraform"
+
+
+def test_parse_terraform_resource_block(tf_tree):
+    """Test parsing a Terraform resource block"""
+    # Verify parsing was successful (no errors) and we can traverse the tree
+    assert not tf_tree.root_node.has_error
+    assert tf_tree.root_node.child_count > 0
+
+
+def test_parse_hcl_file(hcl_tree):
+    """Test parsing a generic HCL file"""
+    assert not hcl_tree.root_node.has_error
+    assert hcl_tree.root_node.child_count > 0
+
+
+def test_terraform_variable_block_parsing(tf_builder, tf_tree):
+    """Test parsing Terraform variable declarations"""
+    variable_code = b'''
 variable "region" {
   description = "AWS region"
   type        = string
   default     = "us-east-1"
 }
 '''
-        builder = ASTChunkBuilder(
-            max_chunk_size=self.max_chunk_size,
-            language="terraform",
-            metadata_template=self.metadata_template
-        )
-        
-        tree = builder.parser.parse(bytes(variable_code, "utf8"))
-        root_node = tree.root_node
-        
-        self.assertFalse(root_node.has_error)
-        
-    def test_terraform_output_block_parsing(self):
-        """Test parsing Terraform output blocks"""
-        output_code = '''
+    # An incremental reparse sets has_error exactly as a cold parse would
+    tree = _reparse_subset(tf_builder.parser, tf_tree, SAMPLE_TERRAFORM, variable_code)
+
+    assert not tree.root_node.has_error
+
+
+def test_terraform_output_block_parsing(tf_builder, tf_tree):
+    """Test parsing Terraform output blocks"""
+    output_code = b'''
 output "instance_id" {
   description = "ID of the EC2 instance"
   value       = aws_instance.web.id
 }
 '''
-        builder = ASTChunkBuilder(
-            max_chunk_size=self.max_chunk_size,
-            language="terraform",
-            metadata_template=self.metadata_template
-        )
-        
-        tree = builder.parser.parse(bytes(output_code, "utf8"))
-        root_node = tree.root_node
-        
-        self.assertFalse(root_node.has_error)
-        
-    def test_hcl_locals_block_parsing(self):
-        """Test parsing HCL locals block"""
-        locals_code = '''
+    # An incremental reparse sets has_error exactly as a cold parse would
+    tree = _reparse_subset(tf_builder.parser, tf_tree, SAMPLE_TERRAFORM, output_code)
+
+    assert not tree.root_node.has_error
+
+
+def test_hcl_locals_block_parsing(hcl_builder):
+    """Test parsing HCL locals block"""
+    locals_code = b'''
 locals {
   environment = "production"
   region      = "us-west-2"
@@ -157,20 +174,14 @@ locals {
   }
 }
 '''
-        builder = ASTChunkBuilder(
-            max_chunk_size=self.max_chunk_size,
-            language="hcl",
-            metadata_template=self.metadata_template
-        )
-        
-        tree = builder.parser.parse(bytes(locals_code, "utf8"))
-        root_node = tree.root_node
-        
-        self.assertFalse(root_node.has_error)
-        
-    def test_terraform_module_block_parsing(self):
-        """Test parsing Terraform module blocks"""
-        module_code = '''
+    tree = hcl_builder.parser.parse(locals_code)
+
+    assert not tree.root_node.has_error
+
+
+def test_terraform_module_block_parsing(tf_builder):
+    """Test parsing Terraform module blocks"""
+    module_code = b'''
 module "vpc" {
   source = "terraform-aws-modules/vpc/aws"
   
@@ -182,39 +193,29 @@ module "vpc" {
   public_subnets  = ["10.0.101.0/24", "10.0.102.0/24"]
 }
 '''
-        builder = ASTChunkBuilder(
-            max_chunk_size=self.max_chunk_size,
-            language="terraform",
-            metadata_template=self.metadata_template
-        )
-        
-        tree = builder.parser.parse(bytes(module_code, "utf8"))
-        root_node = tree.root_node
-        
-        self.assertFalse(root_node.has_error)
-        
-    def test_both_languages_use_same_parser(self):
-        """Test that both 'hcl' and 'terraform' languages can parse the same code"""
-        hcl_builder = ASTChunkBuilder(
-            max_chunk_size=self.max_chunk_size,
-            language="hcl",
-            metadata_template=self.metadata_template
-        )
-        
-        terraform_builder = ASTChunkBuilder(
-            max_chunk_size=self.max_chunk_size,
-            language="terraform",
-            metadata_template=self.metadata_template
-        )
-        
-        # Parse the same code with both parsers
-        hcl_tree = hcl_builder.parser.parse(bytes(self.sample_terraform_code, "utf8"))
-        terraform_tree = terraform_builder.parser.parse(bytes(self.sample_terraform_code, "utf8"))
-        
-        # Both should successfully parse
-        self.assertFalse(hcl_tree.root_node.has_error)
-        self.assertFalse(terraform_tree.root_node.has_error)
+    tree = tf_builder.parser.parse(module_code)
+
+    assert not tree.root_node.has_error
+
+
+def test_incremental_reparse_matches_cold_parse(tf_builder, tf_tree):
+    """Test that reparsing a slice of the baseline gives the same tree as parsing it from scratch"""
+    output_code = SAMPLE_TERRAFORM[SAMPLE_TERRAFORM.index(b"\noutput"):]
+
+    tree = _reparse_subset(tf_builder.parser, tf_tree, SAMPLE_TERRAFORM, output_code)
+
+    assert str(tree.root_node) == str(tf_builder.parser.parse(output_code).root_node)
+
+
+def test_both_languages_use_same_parser(hcl_builder, tf_builder):
+    """Test that both 'hcl' and 'terraform' languages can parse the same code"""
+    # 'terraform' is an alias of 'hcl', so both builders share one Language
+    # and a single parse is representative of both
+    assert hcl_builder.parser.language is tf_builder.parser.language
+
+    tree = hcl_builder.parser.parse(SAMPLE_TERRAFORM)
+    assert not tree.root_node.has_error
 
 
 if __name__ == '__main__':
-    unittest.main()
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -1,12 +1,35 @@
 # tests/test_yaml.py
 
-from astchunk import ASTChunkBuilder
+import logging
 
-def test_openapi_specification():
-    """Test chunking of OpenAPI 3.0 specification"""
-    print("\n=== Testing OpenAPI Specification ===")
-    
-    openapi_yaml = """
+import pytest
+
+from _helpers import _builder, _chunk_sizes
+
+log = logging.getLogger(__name__)
+
+# Chunk builder configs, keyed by (language, max_chunk_size)
+_CFG = {
+    (language, max_chunk_size): {
+        "max_chunk_size": max_chunk_size,
+        "language": language,
+        "metadata_template": "default"
+    }
+    for language, max_chunk_size in [("yaml", 150), ("yaml", 180), ("yaml", 200)]
+}
+
+EMPTY = b""
+
+
+def _contains_any(chunks, needles, lower=False):
+    """Check that every needle occurs in some chunk, without joining the chunks together"""
+    return all(
+        any(n in (c['content'].lower() if lower else c['content']) for c in chunks)
+        for n in needles
+    )
+
+
+OPENAPI_YAML = """
 openapi: 3.0.0
 info:
   title: User Management API
@@ -94,38 +117,25 @@ components:
         lastName:
           type: string
 """
+
+
+def test_openapi_specification():
+    """Test chunking of OpenAPI 3.0 specification"""
+    log.info("Testing OpenAPI Specification")
     
-    configs = {
-        "max_chunk_size": 200,
-        "language": "yaml",
-        "metadata_template": "default"
-    }
-    
-    chunk_builder = ASTChunkBuilder(**configs)
-    chunks = chunk_builder.chunkify(openapi_yaml)
+    chunk_builder = _builder(**_CFG[("yaml", 200)])
+    chunks = chunk_builder.chunkify(OPENAPI_YAML)
     
-    print(f"✓ Generated {len(chunks)} chunks")
     assert len(chunks) > 0
+    assert all('content' in c and 'metadata' in c for c in chunks), "missing keys in chunks"
     
     # Verify content is preserved
-    full_content = ''.join([c['content'] for c in chunks])
-    assert 'openapi' in full_content.lower()
-    assert 'paths' in full_content
-    assert 'components' in full_content
-    
-    for i, chunk in enumerate(chunks):
-        print(f"  Chunk {i+1}: {len(chunk['content'])} chars")
-        assert 'content' in chunk
-        assert 'metadata' in chunk
+    assert _contains_any(chunks, ('openapi', 'paths', 'components'), lower=True)
     
-    print("✓ OpenAPI test passed\n")
+    log.debug("chunk sizes: %s", _chunk_sizes(chunks))
 
 
-def test_docker_compose():
-    """Test chunking of Docker Compose configuration"""
-    print("=== Testing Docker Compose File ===")
-    
-    docker_compose = """
+DOCKER_COMPOSE_YAML = """
 version: '3.8'
 services:
   webapp:
@@ -185,35 +195,25 @@ volumes:
   postgres_data:
   redis_data:
 """
+
+
+def test_docker_compose():
+    """Test chunking of Docker Compose configuration"""
+    log.info("Testing Docker Compose File")
     
-    configs = {
-        "max_chunk_size": 150,
-        "language": "yaml",
-        "metadata_template": "default"
-    }
-    
-    chunk_builder = ASTChunkBuilder(**configs)
-    chunks = chunk_builder.chunkify(docker_compose)
+    chunk_builder = _builder(**_CFG[("yaml", 150)])
+    chunks = chunk_builder.chunkify(DOCKER_COMPOSE_YAML)
     
-    print(f"✓ Generated {len(chunks)} chunks")
     assert len(chunks) > 0
     
     # Verify services are present
-    full_content = ''.join([c['content'] for c in chunks])
-    assert 'services' in full_content
-    assert 'webapp' in full_content or 'db' in full_content
-    
-    for i, chunk in enumerate(chunks):
-        print(f"  Chunk {i+1}: {len(chunk['content'])} chars")
+    assert _contains_any(chunks, ('services',))
+    assert _contains_any(chunks, ('webapp',)) or _contains_any(chunks, ('db',))
     
-    print("✓ Docker Compose test passed\n")
+    log.debug("chunk sizes: %s", _chunk_sizes(chunks))
 
 
-def test_kubernetes_config():
-    """Test chunking of Kubernetes configuration"""
-    print("=== Testing Kubernetes Configuration ===")
-    
-    k8s_yaml = """
+K8S_YAML = """
 apiVersion: apps/v1
 kind: Deployment
 metadata:
@@ -265,30 +265,9 @@ spec:
       targetPort: 80
   type: LoadBalancer
 """
-    
-    configs = {
-        "max_chunk_size": 180,
-        "language": "yaml",
-        "metadata_template": "default"
-    }
-    
-    chunk_builder = ASTChunkBuilder(**configs)
-    chunks = chunk_builder.chunkify(k8s_yaml)
-    
-    print(f"✓ Generated {len(chunks)} chunks")
-    assert len(chunks) > 0
-    
-    for i, chunk in enumerate(chunks):
-        print(f"  Chunk {i+1}: {len(chunk['content'])} chars")
-    
-    print("✓ Kubernetes config test passed\n")
 
 
-def test_ci_cd_pipeline():
-    """Test chunking of CI/CD pipeline configuration (GitHub Actions)"""
-    print("=== Testing CI/CD Pipeline (GitHub Actions) ===")
-    
-    github_actions = """
+GITHUB_ACTIONS_YAML = """
 name: CI/CD Pipeline
 on:
   push:
@@ -352,33 +331,23 @@ jobs:
         run: |
           echo "Deploying to production..."
 """
+
+
+def test_ci_cd_pipeline():
+    """Test chunking of CI/CD pipeline configuration (GitHub Actions)"""
+    log.info("Testing CI/CD Pipeline (GitHub Actions)")
     
-    configs = {
-        "max_chunk_size": 200,
-        "language": "yaml",
-        "metadata_template": "default"
-    }
-    
-    chunk_builder = ASTChunkBuilder(**configs)
-    chunks = chunk_builder.chunkify(github_actions)
+    chunk_builder = _builder(**_CFG[("yaml", 200)])
+    chunks = chunk_builder.chunkify(GITHUB_ACTIONS_YAML)
     
-    print(f"✓ Generated {len(chunks)} chunks")
     assert len(chunks) > 0
     
-    full_content = ''.join([c['content'] for c in chunks])
-    assert 'jobs' in full_content
+    assert _contains_any(chunks, ('jobs',))
     
-    for i, chunk in enumerate(chunks):
-        print(f"  Chunk {i+1}: {len(chunk['content'])} chars")
-    
-    print("✓ CI/CD pipeline test passed\n")
+    log.debug("chunk sizes: %s", _chunk_sizes(chunks))
 
 
-def test_application_config():
-    """Test chunking of application configuration file"""
-    print("=== Testing Application Configuration ===")
-    
-    app_config = """
+APP_CONFIG_YAML = """
 # Application Configuration
 app:
   name: MyApplication
@@ -459,34 +428,23 @@ integrations:
     secret_key: ${AWS_SECRET_KEY}
     s3_bucket: my-app-uploads
 """
+
+
+def test_application_config():
+    """Test chunking of application configuration file"""
+    log.info("Testing Application Configuration")
     
-    configs = {
-        "max_chunk_size": 150,
-        "language": "yaml",
-        "metadata_template": "default"
-    }
-    
-    chunk_builder = ASTChunkBuilder(**configs)
-    chunks = chunk_builder.chunkify(app_config)
+    chunk_builder = _builder(**_CFG[("yaml", 150)])
+    chunks = chunk_builder.chunkify(APP_CONFIG_YAML)
     
-    print(f"✓ Generated {len(chunks)} chunks")
     assert len(chunks) > 0
     
-    full_content = ''.join([c['content'] for c in chunks])
-    assert 'database' in full_content
-    assert 'server' in full_content
-    
-    for i, chunk in enumerate(chunks):
-        print(f"  Chunk {i+1}: {len(chunk['content'])} chars")
+    assert _contains_any(chunks, ('database', 'server'))
     
-    print("✓ Application config test passed\n")
+    log.debug("chunk sizes: %s", _chunk_sizes(chunks))
 
 
-def test_ansible_playbook():
-    """Test chunking of Ansible playbook"""
-    print("=== Testing Ansible Playbook ===")
-    
-    ansible_yaml = """
+ANSIBLE_YAML = """
 ---
 - name: Deploy web application
   hosts: webservers
@@ -551,70 +509,49 @@ def test_ansible_playbook():
         name: nginx
         state: restarted
 """
-    
-    configs = {
-        "max_chunk_size": 180,
-        "language": "yaml",
-        "metadata_template": "default"
-    }
-    
-    chunk_builder = ASTChunkBuilder(**configs)
-    chunks = chunk_builder.chunkify(ansible_yaml)
-    
-    print(f"✓ Generated {len(chunks)} chunks")
-    assert len(chunks) > 0
-    
-    for i, chunk in enumerate(chunks):
-        print(f"  Chunk {i+1}: {len(chunk['content'])} chars")
-    
-    print("✓ Ansible playbook test passed\n")
 
 
-def test_small_config():
-    """Test chunking of small configuration file"""
-    print("=== Testing Small Config File ===")
-    
-    small_yaml = """
+SMALL_YAML = """
 timeout: 30
 retries: 3
 debug: true
 """
-    
-    configs = {
-        "max_chunk_size": 150,
-        "language": "yaml",
-        "metadata_template": "default"
-    }
-    
-    chunk_builder = ASTChunkBuilder(**configs)
-    chunks = chunk_builder.chunkify(small_yaml)
-    
-    print(f"✓ Generated {len(chunks)} chunks")
+
+
+@pytest.mark.parametrize(
+    "key,payload",
+    [
+        (("yaml", 180), K8S_YAML),
+        (("yaml", 180), ANSIBLE_YAML),
+        (("yaml", 150), SMALL_YAML),
+    ],
+    ids=["kubernetes", "ansible", "small-config"]
+)
+def test_yaml_chunking(key, payload):
+    """Test chunking of YAML files that only need to produce chunks"""
+    log.info("Testing YAML")
+
+    chunk_builder = _builder(**_CFG[key])
+    chunks = chunk_builder.chunkify(payload)
+
     assert len(chunks) > 0
-    
-    for i, chunk in enumerate(chunks):
-        print(f"  Chunk {i+1}: {len(chunk['content'])} chars")
-    
-    print("✓ Small config test passed\n")
+
+    log.debug("chunk sizes: %s", _chunk_sizes(chunks))
 
 
 def test_edge_cases():
     """Test edge cases"""
-    print("=== Testing Edge Cases ===")
+    log.info("Testing Edge Cases")
     
-    # Empty YAML
-    print("  Testing empty YAML...")
-    configs = {
-        "max_chunk_size": 150,
-        "language": "yaml",
-        "metadata_template": "default"
-    }
-    chunk_builder = ASTChunkBuilder(**configs)
-    chunks = chunk_builder.chunkify("")
-    print(f"    Empty YAML: {len(chunks)} chunks")
+    # Empty and whitespace-only YAML
+    chunk_builder = _builder(**_CFG[("yaml", 150)])
+    assert chunk_builder.chunkify(EMPTY) == []
+    assert chunk_builder.chunkify("  \n\t\n") == []
+
+    # Bytes are chunked the same way as the equivalent str
+    assert chunk_builder.chunkify(b"key: value\n") == chunk_builder.chunkify("key: value\n")
     
     # YAML with comments
-    print("  Testing YAML with comments...")
     yaml_with_comments = """
 # Main configuration
 database:
@@ -622,11 +559,10 @@ database:
   port: 5432       # default postgres port
 """
     chunks = chunk_builder.chunkify(yaml_with_comments)
-    print(f"    With comments: {len(chunks)} chunks")
+    log.debug("with comments: %d chunks", len(chunks))
     assert len(chunks) > 0
     
     # Multiline strings
-    print("  Testing multiline strings...")
     yaml_multiline = """
 description: |
   This is a long description
@@ -635,31 +571,9 @@ description: |
 key: value
 """
     chunks = chunk_builder.chunkify(yaml_multiline)
-    print(f"    Multiline: {len(chunks)} chunks")
+    log.debug("multiline: %d chunks", len(chunks))
     assert len(chunks) > 0
-    
-    print("✓ Edge cases test passed\n")
 
 
 if __name__ == "__main__":
-    print("\n" + "="*60)
-    print("YAML CHUNKING TEST SUITE")
-    print("="*60)
-    
-    try:
-        test_openapi_specification()
-        test_docker_compose()
-        test_kubernetes_config()
-        test_ci_cd_pipeline()
-        test_application_config()
-        test_ansible_playbook()
-        test_small_config()
-        test_edge_cases()
-        
-        print("="*60)
-        print("✓✓✓ ALL TESTS PASSED ✓✓✓")
-        print("="*60 + "\n")
-    except Exception as e:
-        print(f"\n✗ TEST FAILED: {e}\n")
-        import traceback
-        traceback.print_exc()
+    raise SystemExit(pytest.main([__file__, "-q"]))